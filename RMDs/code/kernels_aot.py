@@ -0,0 +1,50 @@
+"""
+Ahead-of-Time Build of the Strategy Kernels
+
+Compiles the strategy kernels from tax_strategies.py into a native
+extension module, rmd_kernels, using numba.pycc. The compiled module
+needs neither Numba nor a JIT warm-up at run time, so run_simulation.py
+uses it when Numba is not installed instead of running the kernels as
+plain Python.
+
+The AOT batch driver runs serially (pycc does not support parallel=True);
+when Numba is available the JIT driver, cached on disk, is preferred.
+
+Usage:
+    python kernels_aot.py
+"""
+
+from numba.pycc import CC
+
+from tax_strategies import (
+    hold_to_death_kernel,
+    aggressive_conversion_kernel,
+    simulate_strategies_batch,
+)
+
+cc = CC('rmd_kernels')
+
+# (initial_ira, initial_taxable, taxable_basis, start_age, death_age,
+#  market_returns, tax_bracket, cap_gains_rate, ...)
+_KERNEL_ARGS = 'f8, f8, f8, i8, i8, f4[:], f8, f8'
+
+cc.export(
+    'hold_to_death',
+    f'UniTuple(f8, 4)({_KERNEL_ARGS})',
+)(hold_to_death_kernel.py_func)
+
+cc.export(
+    'aggressive_conversion',
+    f'UniTuple(f8, 4)({_KERNEL_ARGS}, f8, i8)',
+)(aggressive_conversion_kernel.py_func)
+
+# prange compiles to a plain range without parallel=True
+cc.export(
+    'simulate_strategies_batch',
+    'void(f4[:, :], i8[:], f8, f8, f8, i8, f8, f8, f8, i8,'
+    ' f8[:, :], f8[:, :], f8[:, :], f8[:, :])',
+)(simulate_strategies_batch.py_func)
+
+
+if __name__ == '__main__':
+    cc.compile()
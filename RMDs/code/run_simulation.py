@@ -10,48 +10,62 @@ This script orchestrates the full Monte Carlo simulation:
 
 Usage:
     python run_simulation.py --n_paths 10000 --seed 42
+    python run_simulation.py --n_paths 100000 --stats-only
 """
 
 import argparse
 import time
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 import numpy as np
 
 try:
     import duckdb
+    import pandas as pd
+    import pyarrow as pa
     HAS_DUCKDB = True
 except ImportError:
     HAS_DUCKDB = False
-    print("Warning: DuckDB not installed. Results will not be persisted.")
+    print("Warning: DuckDB/pandas/PyArrow not installed. Results will not be persisted.")
 
 from simulation_engine import (
-    simulate_gbm_paths,
+    simulate_gbm_returns,
     sample_death_ages_vectorized,
     SimulationConfig,
 )
-from tax_strategies import (
-    simulate_hold_to_death,
-    simulate_aggressive_conversion,
-)
+from tax_strategies import HAS_NUMBA, column_stats, simulate_strategies_batch
+
+if not HAS_NUMBA:
+    try:
+        # Ahead-of-time build of the kernels (see kernels_aot.py)
+        from rmd_kernels import simulate_strategies_batch
+    except ImportError:
+        pass
+
+# Strategy order matches the columns of the batch kernel outputs and the
+# ENUM codes of the strategy column in DuckDB
+STRATEGIES = ('hold_to_death', 'aggressive_conversion')
 
 
 def run_monte_carlo(
     config: SimulationConfig,
     n_paths: int = 1000,
-    seed: int = 42,
+    seed: Optional[int] = 42,
     verbose: bool = True,
-) -> List[Dict]:
+) -> Dict[str, np.ndarray]:
     """
     Run full Monte Carlo simulation.
     
     Args:
         config: Simulation configuration
         n_paths: Number of simulation paths
-        seed: Random seed for reproducibility
+        seed: Random seed for reproducibility (None for a fresh draw)
         verbose: Print progress updates
     
     Returns:
-        List of result dictionaries
+        Dictionary of result arrays. Per-path columns (path_id, death_age,
+        years_lived) have shape (n_paths,); per-strategy metrics have shape
+        (n_paths, 2) with columns ordered as STRATEGIES.
     """
     if verbose:
         print(f"Running {n_paths:,} simulations...")
@@ -63,90 +77,69 @@ def run_monte_carlo(
     
     start_time = time.time()
     
-    # Generate market paths
-    max_years = config.max_age - config.start_age
-    market_paths = simulate_gbm_paths(
-        S0=1.0,  # Normalized; we'll use returns
-        mu=config.mu,
-        sigma=config.sigma,
-        T=max_years,
-        n_paths=n_paths,
-        seed=seed,
-    )
-    # Convert to returns
-    market_returns = market_paths[:, 1:] / market_paths[:, :-1] - 1
+    # Columnar result buffers; strategy j of path i lives at [i, j]
+    results = {
+        'path_id': np.arange(n_paths, dtype=np.int32),
+        'terminal_wealth': np.empty((n_paths, len(STRATEGIES))),
+        'total_taxes_paid': np.empty((n_paths, len(STRATEGIES))),
+        'total_rmd_withdrawals': np.empty((n_paths, len(STRATEGIES))),
+        'step_up_benefit': np.empty((n_paths, len(STRATEGIES))),
+    }
     
-    if verbose:
-        print(f"  Generated {n_paths:,} market paths ({max_years} years each)")
+    # Market and mortality sampling get independent child streams of the
+    # run seed, so sweeping seed never reuses one run's market stream as
+    # another's mortality stream. The two draws share no state and run
+    # concurrently.
+    max_years = config.max_age - config.start_age
+    # An unseeded run passes None through (fresh entropy, never cached)
+    if seed is None:
+        market_seed = mortality_seed = None
+    else:
+        market_seed, mortality_seed = np.random.SeedSequence(seed).spawn(2)
     
-    # Sample death ages
-    death_ages = sample_death_ages_vectorized(
-        current_age=config.start_age,
-        n_samples=n_paths,
-        gender=config.gender,
-        max_age=config.max_age,
-        seed=seed + 1,  # Different seed for mortality
-    )
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        returns_future = pool.submit(
+            simulate_gbm_returns,
+            mu=config.mu,
+            sigma=config.sigma,
+            T=max_years,
+            n_paths=n_paths,
+            seed=market_seed,
+        )
+        death_ages_future = pool.submit(
+            sample_death_ages_vectorized,
+            current_age=config.start_age,
+            n_samples=n_paths,
+            gender=config.gender,
+            max_age=config.max_age,
+            seed=mortality_seed,
+        )
+        market_returns = returns_future.result()
+        death_ages = death_ages_future.result()
     
     if verbose:
+        print(f"  Generated {n_paths:,} market paths ({max_years} years each)")
         print(f"  Sampled death ages: min={death_ages.min()}, max={death_ages.max()}, mean={death_ages.mean():.1f}")
     
-    # Run simulations for both strategies
-    results = []
-    
-    for i in range(n_paths):
-        death_age = int(death_ages[i])
-        returns = market_returns[i, :]
-        
-        # Strategy 1: Hold to Death
-        tw1, tax1, rmd1, step1, _ = simulate_hold_to_death(
-            initial_ira=config.initial_ira,
-            initial_taxable=config.initial_taxable,
-            taxable_basis=config.taxable_basis,
-            start_age=config.start_age,
-            death_age=death_age,
-            market_returns=returns,
-            tax_bracket=config.tax_bracket,
-            cap_gains_rate=config.cap_gains_rate,
-        )
-        
-        results.append({
-            'path_id': i,
-            'strategy': 'hold_to_death',
-            'death_age': death_age,
-            'years_lived': death_age - config.start_age,
-            'terminal_wealth': tw1,
-            'total_taxes_paid': tax1,
-            'total_rmd_withdrawals': rmd1,
-            'step_up_benefit': step1,
-        })
-        
-        # Strategy 2: Aggressive Conversion
-        tw2, tax2, rmd2, step2, _ = simulate_aggressive_conversion(
-            initial_ira=config.initial_ira,
-            initial_taxable=config.initial_taxable,
-            taxable_basis=config.taxable_basis,
-            start_age=config.start_age,
-            death_age=death_age,
-            market_returns=returns,
-            tax_bracket=config.tax_bracket,
-            cap_gains_rate=config.cap_gains_rate,
-            annual_conversion=100_000,
-        )
-        
-        results.append({
-            'path_id': i,
-            'strategy': 'aggressive_conversion',
-            'death_age': death_age,
-            'years_lived': death_age - config.start_age,
-            'terminal_wealth': tw2,
-            'total_taxes_paid': tax2,
-            'total_rmd_withdrawals': rmd2,
-            'step_up_benefit': step2,
-        })
-        
-        if verbose and (i + 1) % 1000 == 0:
-            print(f"  Completed {i + 1:,} paths...")
+    # Run both strategies over all paths in one compiled, parallel pass
+    simulate_strategies_batch(
+        market_returns,
+        death_ages,
+        float(config.initial_ira),
+        float(config.initial_taxable),
+        float(config.taxable_basis),
+        config.start_age,
+        config.tax_bracket,
+        config.cap_gains_rate,
+        100_000.0,  # Annual Roth conversion
+        72,         # Last conversion age
+        results['terminal_wealth'],
+        results['total_taxes_paid'],
+        results['total_rmd_withdrawals'],
+        results['step_up_benefit'],
+    )
+    results['death_age'] = death_ages
+    results['years_lived'] = death_ages - config.start_age
     
     elapsed = time.time() - start_time
     if verbose:
@@ -155,46 +148,176 @@ def run_monte_carlo(
     return results
 
 
-def store_results_duckdb(results: List[Dict], db_path: str = 'simulation.duckdb'):
-    """Store simulation results in DuckDB."""
+def summarize_results(results: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Compute per-strategy summary statistics in memory, without DuckDB.
+    
+    Mean, standard deviation, min and max come from a single parallel
+    pass over terminal wealth; the 5% and 50% quantiles use np.quantile
+    (a partial sort) instead of a full sort.
+    
+    Returns:
+        Dictionary of arrays with one entry per strategy, ordered as STRATEGIES
+    """
+    terminal_wealth = results['terminal_wealth']
+    mean, variance, minimum, maximum = column_stats(terminal_wealth)
+    var_95, median = np.quantile(terminal_wealth, [0.05, 0.50], axis=0)
+    
+    return {
+        'avg_wealth': mean,
+        'std_wealth': np.sqrt(variance),
+        'min_wealth': minimum,
+        'max_wealth': maximum,
+        'var_95': var_95,
+        'median': median,
+        'avg_taxes': results['total_taxes_paid'].mean(axis=0),
+        'avg_step_up': results['step_up_benefit'].mean(axis=0),
+    }
+
+
+def print_summary(summary: Dict[str, np.ndarray], n_paths: int):
+    """Print the in-memory strategy comparison from summarize_results."""
+    print("\n" + "="*60)
+    print("SIMULATION SUMMARY (in memory)")
+    print("="*60)
+    
+    for j, strategy in enumerate(STRATEGIES):
+        print(f"\nStrategy: {strategy}")
+        print(f"  Paths: {n_paths:,}")
+        print(f"  Avg Terminal Wealth: ${summary['avg_wealth'][j]:,.0f}")
+        print(f"  Std Dev: ${summary['std_wealth'][j]:,.0f}")
+        print(f"  VaR (5%): ${summary['var_95'][j]:,.0f}")
+        print(f"  Median: ${summary['median'][j]:,.0f}")
+        print(f"  Min / Max: ${summary['min_wealth'][j]:,.0f} / ${summary['max_wealth'][j]:,.0f}")
+        print(f"  Avg Taxes Paid: ${summary['avg_taxes'][j]:,.0f}")
+        print(f"  Avg Step-Up Benefit: ${summary['avg_step_up'][j]:,.0f}")
+
+
+def store_results_duckdb(results: Dict[str, np.ndarray], db_path: str = 'simulation.duckdb'):
+    """Store simulation results in DuckDB via a single Arrow bulk insert."""
     if not HAS_DUCKDB:
         print("DuckDB not available. Skipping storage.")
         return
     
     conn = duckdb.connect(db_path)
     
-    # Create table
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS simulation_results (
+    # Create table (replacing any previous run, whose path_ids would collide)
+    strategy_enum = ", ".join(f"'{name}'" for name in STRATEGIES)
+    conn.execute(f"""
+        CREATE OR REPLACE TABLE simulation_results (
             path_id INTEGER,
-            strategy VARCHAR,
+            strategy ENUM({strategy_enum}),
             death_age INTEGER,
             years_lived INTEGER,
             terminal_wealth DOUBLE,
             total_taxes_paid DOUBLE,
             total_rmd_withdrawals DOUBLE,
-            step_up_benefit DOUBLE
+            step_up_benefit DOUBLE,
+            PRIMARY KEY (path_id, strategy)
         )
     """)
     
-    # Insert results
-    conn.executemany("""
-        INSERT INTO simulation_results VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, [(r['path_id'], r['strategy'], r['death_age'], r['years_lived'],
-           r['terminal_wealth'], r['total_taxes_paid'], r['total_rmd_withdrawals'],
-           r['step_up_benefit']) for r in results])
+    # Insert results straight from the columns (no per-row binding),
+    # one row per (path, strategy) in path_id order
+    n_paths = len(results['path_id'])
+    n_strategies = len(STRATEGIES)
+    results_arrow = pa.table({
+        'path_id': np.repeat(results['path_id'], n_strategies),
+        'strategy': pa.DictionaryArray.from_arrays(
+            np.tile(np.arange(n_strategies, dtype=np.int8), n_paths),
+            list(STRATEGIES),
+        ),
+        'death_age': np.repeat(results['death_age'], n_strategies),
+        'years_lived': np.repeat(results['years_lived'], n_strategies),
+        'terminal_wealth': results['terminal_wealth'].ravel(),
+        'total_taxes_paid': results['total_taxes_paid'].ravel(),
+        'total_rmd_withdrawals': results['total_rmd_withdrawals'].ravel(),
+        'step_up_benefit': results['step_up_benefit'].ravel(),
+    })
+    conn.register('results_arrow', results_arrow)
+    conn.execute("INSERT INTO simulation_results SELECT * FROM results_arrow")
+    conn.unregister('results_arrow')
     
-    print(f"Stored {len(results):,} results in {db_path}")
+    print(f"Stored {results_arrow.num_rows:,} results in {db_path}")
     conn.close()
 
 
-def analyze_results(db_path: str = 'simulation.duckdb'):
-    """Run analysis queries on simulation results."""
+def analyze_results(db_path: str = 'simulation.duckdb') -> Optional[Dict[str, 'pd.DataFrame']]:
+    """
+    Run analysis queries on simulation results.
+    
+    All aggregates come from one multi-CTE query, so DuckDB scans
+    simulation_results once; the report is then printed from memory.
+    
+    Returns:
+        Dictionary of DataFrames keyed by 'strategy', 'tax_alpha',
+        'win_rate' and 'lifespan'
+    """
     if not HAS_DUCKDB:
         print("DuckDB not available.")
-        return
+        return None
 
     conn = duckdb.connect(db_path)
+    summary = conn.execute("""
+        WITH base AS (
+            SELECT
+                path_id,
+                strategy,
+                terminal_wealth,
+                total_taxes_paid,
+                step_up_benefit,
+                CASE
+                    WHEN death_age < 75 THEN 'Early (< 75)'
+                    WHEN death_age < 85 THEN 'Mid (75-84)'
+                    ELSE 'Late (85+)'
+                END as lifespan_group
+            FROM simulation_results
+        ),
+        grouped AS (
+            SELECT
+                strategy,
+                lifespan_group,
+                GROUPING(lifespan_group) = 1 as is_strategy_total,
+                COUNT(*) as n_paths,
+                AVG(terminal_wealth) as avg_wealth,
+                STDDEV(terminal_wealth) as std_wealth,
+                PERCENTILE_CONT(0.05) WITHIN GROUP (ORDER BY terminal_wealth) as var_95,
+                PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY terminal_wealth) as median,
+                AVG(total_taxes_paid) as avg_taxes,
+                AVG(step_up_benefit) as avg_step_up
+            FROM base
+            GROUP BY GROUPING SETS ((strategy), (lifespan_group, strategy))
+        ),
+        paired AS (
+            SELECT
+                path_id,
+                MAX(terminal_wealth) FILTER (WHERE strategy = 'hold_to_death') as hold_wealth,
+                MAX(terminal_wealth) FILTER (WHERE strategy = 'aggressive_conversion') as convert_wealth
+            FROM base
+            GROUP BY path_id
+        ),
+        wins AS (
+            SELECT
+                COUNT(*) as total,
+                CAST(SUM(CASE WHEN hold_wealth > convert_wealth THEN 1 ELSE 0 END) AS BIGINT) as hold_wins,
+                CAST(SUM(CASE WHEN convert_wealth > hold_wealth THEN 1 ELSE 0 END) AS BIGINT) as convert_wins
+            FROM paired
+            WHERE hold_wealth IS NOT NULL AND convert_wealth IS NOT NULL
+        )
+        SELECT grouped.*, wins.total, wins.hold_wins, wins.convert_wins
+        FROM grouped
+        CROSS JOIN wins
+        ORDER BY lifespan_group, strategy
+    """).fetchdf()
+    conn.close()
+
+    strategy_stats = summary[summary['is_strategy_total']].reset_index(drop=True)
+    lifespan_stats = summary[~summary['is_strategy_total']].reset_index(drop=True)
+    hold_wealth = strategy_stats.loc[strategy_stats['strategy'] == 'hold_to_death', 'avg_wealth']
+    tax_alpha = strategy_stats[['strategy', 'avg_wealth']].assign(
+        tax_alpha=strategy_stats['avg_wealth'] - hold_wealth.iloc[0]
+    )
+    win_rate = summary[['total', 'hold_wins', 'convert_wins']].head(1)
 
     print("\n" + "="*60)
     print("SIMULATION RESULTS ANALYSIS")
@@ -203,72 +326,26 @@ def analyze_results(db_path: str = 'simulation.duckdb'):
     # Strategy comparison
     print("\n1. STRATEGY COMPARISON")
     print("-"*40)
-    result = conn.execute("""
-        SELECT
-            strategy,
-            COUNT(*) as n_paths,
-            AVG(terminal_wealth) as avg_wealth,
-            STDDEV(terminal_wealth) as std_wealth,
-            PERCENTILE_CONT(0.05) WITHIN GROUP (ORDER BY terminal_wealth) as var_95,
-            PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY terminal_wealth) as median,
-            AVG(total_taxes_paid) as avg_taxes,
-            AVG(step_up_benefit) as avg_step_up
-        FROM simulation_results
-        GROUP BY strategy
-    """).fetchall()
-
-    for row in result:
-        print(f"\nStrategy: {row[0]}")
-        print(f"  Paths: {row[1]:,}")
-        print(f"  Avg Terminal Wealth: ${row[2]:,.0f}")
-        print(f"  Std Dev: ${row[3]:,.0f}")
-        print(f"  VaR (5%): ${row[4]:,.0f}")
-        print(f"  Median: ${row[5]:,.0f}")
-        print(f"  Avg Taxes Paid: ${row[6]:,.0f}")
-        print(f"  Avg Step-Up Benefit: ${row[7]:,.0f}")
+    for row in strategy_stats.itertuples():
+        print(f"\nStrategy: {row.strategy}")
+        print(f"  Paths: {row.n_paths:,}")
+        print(f"  Avg Terminal Wealth: ${row.avg_wealth:,.0f}")
+        print(f"  Std Dev: ${row.std_wealth:,.0f}")
+        print(f"  VaR (5%): ${row.var_95:,.0f}")
+        print(f"  Median: ${row.median:,.0f}")
+        print(f"  Avg Taxes Paid: ${row.avg_taxes:,.0f}")
+        print(f"  Avg Step-Up Benefit: ${row.avg_step_up:,.0f}")
 
     # Tax Alpha calculation
     print("\n2. TAX ALPHA")
     print("-"*40)
-    result = conn.execute("""
-        WITH strategy_avgs AS (
-            SELECT strategy, AVG(terminal_wealth) as avg_wealth
-            FROM simulation_results
-            GROUP BY strategy
-        )
-        SELECT
-            a.strategy,
-            a.avg_wealth,
-            a.avg_wealth - b.avg_wealth as tax_alpha
-        FROM strategy_avgs a
-        CROSS JOIN (SELECT avg_wealth FROM strategy_avgs WHERE strategy = 'hold_to_death') b
-    """).fetchall()
-
-    for row in result:
-        print(f"{row[0]}: ${row[1]:,.0f} (Alpha: ${row[2]:+,.0f})")
+    for row in tax_alpha.itertuples():
+        print(f"{row.strategy}: ${row.avg_wealth:,.0f} (Alpha: ${row.tax_alpha:+,.0f})")
 
     # Win rate
     print("\n3. WIN RATE (Head-to-Head)")
     print("-"*40)
-    result = conn.execute("""
-        WITH paired AS (
-            SELECT
-                a.path_id,
-                a.terminal_wealth as hold_wealth,
-                b.terminal_wealth as convert_wealth
-            FROM simulation_results a
-            JOIN simulation_results b ON a.path_id = b.path_id
-            WHERE a.strategy = 'hold_to_death'
-              AND b.strategy = 'aggressive_conversion'
-        )
-        SELECT
-            COUNT(*) as total,
-            SUM(CASE WHEN hold_wealth > convert_wealth THEN 1 ELSE 0 END) as hold_wins,
-            SUM(CASE WHEN convert_wealth > hold_wealth THEN 1 ELSE 0 END) as convert_wins
-        FROM paired
-    """).fetchone()
-
-    total, hold_wins, convert_wins = result
+    total, hold_wins, convert_wins = win_rate.iloc[0]
     print(f"Total comparisons: {total:,}")
     print(f"Hold-to-Death wins: {hold_wins:,} ({100*hold_wins/total:.1f}%)")
     print(f"Aggressive Conversion wins: {convert_wins:,} ({100*convert_wins/total:.1f}%)")
@@ -276,25 +353,15 @@ def analyze_results(db_path: str = 'simulation.duckdb'):
     # By lifespan
     print("\n4. RESULTS BY LIFESPAN")
     print("-"*40)
-    result = conn.execute("""
-        SELECT
-            CASE
-                WHEN death_age < 75 THEN 'Early (< 75)'
-                WHEN death_age < 85 THEN 'Mid (75-84)'
-                ELSE 'Late (85+)'
-            END as lifespan_group,
-            strategy,
-            COUNT(*) as n,
-            AVG(terminal_wealth) as avg_wealth
-        FROM simulation_results
-        GROUP BY 1, 2
-        ORDER BY 1, 2
-    """).fetchall()
-
-    for row in result:
-        print(f"{row[0]} | {row[1]}: ${row[3]:,.0f} (n={row[2]})")
+    for row in lifespan_stats.itertuples():
+        print(f"{row.lifespan_group} | {row.strategy}: ${row.avg_wealth:,.0f} (n={row.n_paths})")
 
-    conn.close()
+    return {
+        'strategy': strategy_stats,
+        'tax_alpha': tax_alpha,
+        'win_rate': win_rate,
+        'lifespan': lifespan_stats,
+    }
 
 
 def main():
@@ -305,6 +372,8 @@ def main():
     parser.add_argument('--sigma', type=float, default=0.16, help='Volatility')
     parser.add_argument('--db', type=str, default='simulation.duckdb', help='Database path')
     parser.add_argument('--analyze-only', action='store_true', help='Only run analysis')
+    parser.add_argument('--stats-only', action='store_true',
+                        help='Print in-memory summary statistics and skip DuckDB')
 
     args = parser.parse_args()
 
@@ -315,6 +384,9 @@ def main():
         )
 
         results = run_monte_carlo(config, n_paths=args.n_paths, seed=args.seed)
+        if args.stats_only:
+            print_summary(summarize_results(results), args.n_paths)
+            return
         store_results_duckdb(results, args.db)
 
     analyze_results(args.db)
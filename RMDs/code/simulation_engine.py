@@ -9,9 +9,26 @@ This module provides the core simulation functionality:
 """
 
 import numpy as np
-from typing import Tuple, List, Dict, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Tuple, List, Dict, Optional, Union
 from dataclasses import dataclass
-from ssa_life_tables import get_death_probability
+from ssa_life_tables import get_death_probability, _Q_TABLE
+
+try:
+    from scipy.stats import norm, qmc
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+    print("Warning: SciPy not installed. Falling back to pseudorandom sampling.")
+
+# Anything np.random.default_rng accepts as a seed; SeedSequence children
+# give independent streams (e.g. market vs. mortality) from one run seed
+Seed = Union[int, np.random.SeedSequence, None]
+
+# Default sampler: scrambled Sobol quasi-random points when SciPy is
+# available, otherwise plain pseudorandom draws
+DEFAULT_SAMPLER = 'sobol' if HAS_SCIPY else 'random'
 
 
 @dataclass
@@ -76,13 +93,12 @@ def simulate_gbm_paths(
         np.ndarray of shape (n_paths, T+1) containing price paths
         Column 0 is the initial value, columns 1..T are year-end values
     """
-    if seed is not None:
-        np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     
     dt = 1.0  # Annual time steps
     
     # Generate standard normal random variables
-    Z = np.random.standard_normal((n_paths, T))
+    Z = rng.standard_normal((n_paths, T))
     
     # Calculate log returns for each period
     # Using the exact solution to GBM SDE
@@ -99,6 +115,143 @@ def simulate_gbm_paths(
     return paths
 
 
+def _sobol_uniforms(n: int, d: int, seed: Seed = None) -> np.ndarray:
+    """
+    Draw n points of a scrambled d-dimensional Sobol sequence in (0, 1).
+    
+    Points are generated in the smallest power-of-2 block holding n and
+    truncated to n, then pulled slightly in from 0 and 1 so they stay
+    finite under an inverse normal CDF. Sobol's balance properties only
+    hold for a full block, so n should be a power of 2 (e.g. 1024 rather
+    than 1000) for the best convergence.
+    """
+    sobol = qmc.Sobol(d=d, scramble=True, seed=np.random.default_rng(seed))
+    u = sobol.random_base2(max(int(np.ceil(np.log2(max(n, 1)))), 0))[:n]
+    return 0.5 + (1 - 1e-10) * (u - 0.5)
+
+
+# Standard normal draws keyed by (n_paths, T, seed, method), shared across
+# runs. Least recently used entries are evicted past _NOISE_CACHE_SIZE
+# (100k paths x 35 years of float32 is ~14 MB per entry).
+_NOISE_CACHE: 'OrderedDict[Tuple, np.ndarray]' = OrderedDict()
+_NOISE_CACHE_SIZE = 4
+
+
+def _seed_key(seed: Seed):
+    """Hashable value identifying a seed (SeedSequences compare by identity)."""
+    if isinstance(seed, np.random.SeedSequence):
+        return (seed.entropy, seed.spawn_key)
+    return seed
+
+
+def generate_noise(
+    n_paths: int,
+    T: int,
+    seed: Seed = None,
+    method: str = DEFAULT_SAMPLER,
+) -> np.ndarray:
+    """
+    Generate the standard normal shocks that drive the GBM returns.
+    
+    With method='sobol' the shocks come from a scrambled Sobol sequence
+    (one dimension per year) mapped through the inverse normal CDF. For
+    smooth outputs like terminal wealth, quasi-Monte Carlo error shrinks
+    close to O(1/N) rather than O(1/sqrt(N)), so far fewer paths give the
+    same precision. method='random' uses pseudorandom normals.
+    
+    Seeded draws are cached, so runs that only change mu or sigma reuse
+    the same shocks (common random numbers): the RNG cost is paid once,
+    and differences between parameter sets are not masked by noise.
+    
+    Args:
+        n_paths: Number of independent paths
+        T: Number of years per path
+        seed: Random seed or SeedSequence; unseeded draws are not cached
+        method: 'sobol' or 'random'
+    
+    Returns:
+        Read-only np.ndarray of shape (n_paths, T) and dtype float32
+    """
+    key = (n_paths, T, _seed_key(seed), method)
+    if seed is not None and key in _NOISE_CACHE:
+        _NOISE_CACHE.move_to_end(key)
+        return _NOISE_CACHE[key]
+    
+    if method == 'sobol':
+        Z = norm.ppf(_sobol_uniforms(n_paths, T, seed)).astype(np.float32)
+    elif method == 'random':
+        rng = np.random.default_rng(seed)
+        Z = rng.standard_normal((n_paths, T), dtype=np.float32)
+    else:
+        raise ValueError(f"Unknown sampling method: {method!r}")
+    Z.setflags(write=False)
+    
+    if seed is not None:
+        _NOISE_CACHE[key] = Z
+        if len(_NOISE_CACHE) > _NOISE_CACHE_SIZE:
+            _NOISE_CACHE.popitem(last=False)
+    return Z
+
+
+def noise_to_returns(Z: np.ndarray, mu: float, sigma: float) -> np.ndarray:
+    """
+    Convert standard normal shocks into annual simple GBM returns.
+    
+    Each year's return is exp(log_return) - 1, so no price paths, cumsum,
+    or division pass is needed. The returns keep Z's float32 dtype: a
+    year's return only needs ~6 significant digits, and the strategy
+    kernels accumulate balances in float64.
+    
+    Args:
+        Z: Standard normal shocks of shape (n_paths, T)
+        mu: Annual drift (expected return), e.g., 0.07 for 7%
+        sigma: Annual volatility (std dev of returns), e.g., 0.16 for 16%
+    
+    Returns:
+        np.ndarray of the same shape and dtype as Z containing annual returns
+    """
+    dt = 1.0  # Annual time steps
+    drift = np.float32((mu - 0.5 * sigma**2) * dt)
+    vol = np.float32(sigma * np.sqrt(dt))
+    
+    # Build log returns in a fresh buffer (Z may be cached), then convert
+    # to simple returns in place
+    returns = np.multiply(Z, vol)
+    returns += drift
+    np.expm1(returns, out=returns)
+    
+    return returns
+
+
+def simulate_gbm_returns(
+    mu: float,
+    sigma: float,
+    T: int,
+    n_paths: int,
+    seed: Seed = None,
+    method: str = DEFAULT_SAMPLER,
+) -> np.ndarray:
+    """
+    Generate annual simple returns under Geometric Brownian Motion.
+    
+    Equivalent to get_annual_returns(simulate_gbm_paths(...)) but never
+    builds the price paths. See generate_noise and noise_to_returns.
+    
+    Args:
+        mu: Annual drift (expected return), e.g., 0.07 for 7%
+        sigma: Annual volatility (std dev of returns), e.g., 0.16 for 16%
+        T: Number of years to simulate
+        n_paths: Number of independent paths to generate
+        seed: Random seed or SeedSequence for reproducibility
+        method: 'sobol' or 'random' (see generate_noise)
+    
+    Returns:
+        np.ndarray of shape (n_paths, T) and dtype float32 containing
+        annual returns
+    """
+    return noise_to_returns(generate_noise(n_paths, T, seed, method), mu, sigma)
+
+
 def get_annual_returns(paths: np.ndarray) -> np.ndarray:
     """
     Calculate annual returns from price paths.
@@ -141,8 +294,7 @@ def sample_death_ages(
     Returns:
         np.ndarray of death ages, shape (n_samples,)
     """
-    if seed is not None:
-        np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     
     death_ages = np.zeros(n_samples, dtype=int)
     
@@ -150,7 +302,7 @@ def sample_death_ages(
         age = current_age
         while age < max_age:
             q_x = get_death_probability(age, gender)
-            if np.random.random() < q_x:
+            if rng.random() < q_x:
                 # Person dies this year
                 death_ages[i] = age
                 break
@@ -162,36 +314,48 @@ def sample_death_ages(
     return death_ages
 
 
+@lru_cache(maxsize=32)
+def _death_cdf(current_age: int, gender: str, max_age: int) -> np.ndarray:
+    """
+    CDF of death age from current_age to max_age (read-only, cached).
+    
+    The curve depends only on these three arguments, so repeated runs that
+    vary market parameters reuse it instead of rebuilding it.
+    """
+    # Build survival curve from current_age to max_age
+    idx = 0 if gender == 'M' else 1
+    q = _Q_TABLE[current_age:max_age, idx]
+    survival_probs = np.concatenate(([1.0], np.cumprod(1.0 - q)))
+    
+    # CDF of death = 1 - survival. Anyone still alive at max_age is
+    # counted as dying at max_age, so the last entry is exactly 1.0 and
+    # inverse sampling can never land past max_age.
+    death_cdf = 1 - survival_probs
+    death_cdf[-1] = 1.0
+    death_cdf.setflags(write=False)
+    
+    return death_cdf
+
+
 def sample_death_ages_vectorized(
     current_age: int,
     n_samples: int,
     gender: str = 'M',
     max_age: int = 119,
-    seed: Optional[int] = None
+    seed: Seed = None,
 ) -> np.ndarray:
     """
     Vectorized version of death age sampling (faster for large n_samples).
     
-    Pre-computes survival probabilities and uses inverse transform sampling.
+    Uses a cached death-age CDF and inverse transform sampling with
+    pseudorandom uniforms. (A scrambled 1-D Sobol sequence would match
+    dimension 0 of the Sobol market shocks from generate_noise, tying each
+    path's death age to its year-1 return.)
     """
-    if seed is not None:
-        np.random.seed(seed)
-    
-    # Build survival curve from current_age to max_age
-    ages = np.arange(current_age, max_age + 1)
-    survival_probs = np.ones(len(ages))
-    
-    for i, age in enumerate(ages[:-1]):
-        q_x = get_death_probability(age, gender)
-        survival_probs[i + 1] = survival_probs[i] * (1 - q_x)
-    
-    # CDF of death = 1 - survival
-    death_cdf = 1 - survival_probs
+    death_cdf = _death_cdf(current_age, gender.upper(), max_age)
     
     # Sample uniform and invert CDF
-    u = np.random.random(n_samples)
+    u = np.random.default_rng(seed).random(n_samples)
     death_ages = np.searchsorted(death_cdf, u) + current_age
-    death_ages = np.clip(death_ages, current_age, max_age)
     
     return death_ages
-
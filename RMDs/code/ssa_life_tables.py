@@ -6,6 +6,8 @@ Used in 2025 Trustees Report
 This module provides mortality data for survival analysis in Monte Carlo simulations.
 """
 
+import numpy as np
+
 # Death probability (q_x) by age - probability of dying within one year
 # Format: {age: (male_death_prob, female_death_prob)}
 
@@ -69,6 +71,17 @@ SSA_DEATH_PROBABILITY = {
     119: (1.000000, 1.000000),
 }
 
+# Death probabilities for every age 0-119, linearly interpolated between the
+# ages listed above. Column 0 is male, column 1 is female.
+_TABLE_AGES = np.array(sorted(SSA_DEATH_PROBABILITY))
+_Q_TABLE = np.empty((120, 2), dtype=np.float64)
+for _idx in range(2):
+    _Q_TABLE[:, _idx] = np.interp(
+        np.arange(120),
+        _TABLE_AGES,
+        [SSA_DEATH_PROBABILITY[a][_idx] for a in _TABLE_AGES],
+    )
+
 # Life expectancy by age
 # Format: {age: (male_life_expectancy, female_life_expectancy)}
 SSA_LIFE_EXPECTANCY = {
@@ -110,25 +123,10 @@ def get_death_probability(age: int, gender: str = 'M') -> float:
     Returns:
         Probability of dying within one year (0.0 to 1.0)
     """
-    idx = 0 if gender.upper() == 'M' else 1
-    
-    # Find closest age in table
-    if age in SSA_DEATH_PROBABILITY:
-        return SSA_DEATH_PROBABILITY[age][idx]
-    
-    # Interpolate between known ages
-    ages = sorted(SSA_DEATH_PROBABILITY.keys())
-    for i, a in enumerate(ages):
-        if a > age:
-            lower_age = ages[i-1]
-            upper_age = a
-            lower_prob = SSA_DEATH_PROBABILITY[lower_age][idx]
-            upper_prob = SSA_DEATH_PROBABILITY[upper_age][idx]
-            # Linear interpolation
-            frac = (age - lower_age) / (upper_age - lower_age)
-            return lower_prob + frac * (upper_prob - lower_prob)
+    if age >= _Q_TABLE.shape[0]:
+        return 1.0  # Age beyond table
     
-    return 1.0  # Age beyond table
+    return float(_Q_TABLE[age, 0 if gender.upper() == 'M' else 1])
 
 
 def get_life_expectancy(age: int, gender: str = 'M') -> float:
@@ -6,12 +6,33 @@ This module implements:
 2. Hold-to-Death strategy
 3. Aggressive Conversion strategy
 4. Terminal wealth calculation with step-up in basis
+5. Numba-compiled kernels for running both strategies over many paths
 """
 
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    from numba import njit, prange, vectorize
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    print("Warning: Numba not installed. Strategy kernels will run as plain Python"
+          " unless built ahead of time with kernels_aot.py.")
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    def vectorize(*args, **kwargs):
+        """Stand-in for numba.vectorize built on np.vectorize."""
+        return lambda func: np.vectorize(func, otypes=[np.float64])
+
+    prange = range
+
 # IRS Uniform Lifetime Table (2024)
 # Used to calculate RMD divisor based on age
 RMD_DIVISORS = {
@@ -27,17 +48,14 @@ RMD_DIVISORS = {
     117: 2.7, 118: 2.5, 119: 2.3, 120: 2.0,
 }
 
+# Age at which RMDs begin (SECURE 2.0)
+RMD_START_AGE = 73
 
-def get_rmd_divisor(age: int) -> float:
-    """Get the RMD distribution period for a given age."""
-    if age < 72:
-        return 0.0  # No RMD required
-    if age in RMD_DIVISORS:
-        return RMD_DIVISORS[age]
-    if age > 120:
-        return 2.0
-    # Interpolate for missing ages
-    return RMD_DIVISORS.get(age, 2.0)
+# Divisors as a read-only flat array indexed directly by age, so compiled
+# kernels never touch a Python dict. Ages past the table use 2.0.
+RMD_DIVISOR_ARR = np.full(200, 2.0, dtype=np.float64)
+RMD_DIVISOR_ARR[list(RMD_DIVISORS)] = list(RMD_DIVISORS.values())
+RMD_DIVISOR_ARR.setflags(write=False)
 
 
 def calculate_rmd(ira_balance: float, age: int) -> float:
@@ -53,27 +71,45 @@ def calculate_rmd(ira_balance: float, age: int) -> float:
     Returns:
         Required minimum distribution amount
     """
-    if age < 73:  # RMDs start at 73 (as of SECURE 2.0)
+    if age < RMD_START_AGE:  # RMDs start at 73 (as of SECURE 2.0)
         return 0.0
     
-    divisor = get_rmd_divisor(age)
-    if divisor <= 0:
-        return ira_balance  # Distribute everything
-    
-    return ira_balance / divisor
+    return ira_balance / RMD_DIVISOR_ARR[min(age, RMD_DIVISOR_ARR.shape[0] - 1)]
 
 
 @dataclass
-class YearSnapshot:
-    """State at end of a simulation year."""
-    year: int
-    age: int
-    ira_balance: float
-    taxable_balance: float
-    taxable_basis: float
-    rmd_taken: float
-    taxes_paid: float
-    market_return: float
+class Snapshots:
+    """
+    State at the end of each simulation year, one array per field.
+    
+    Entry i of every array describes year i + 1, so a column can be
+    analyzed directly (e.g. snapshots.ira_balance.max()).
+    """
+    year: np.ndarray
+    age: np.ndarray
+    ira_balance: np.ndarray
+    taxable_balance: np.ndarray
+    taxable_basis: np.ndarray
+    rmd_taken: np.ndarray
+    taxes_paid: np.ndarray
+    market_return: np.ndarray
+    
+    @classmethod
+    def empty(cls, n_years: int) -> 'Snapshots':
+        """Allocate uninitialized columns for n_years years."""
+        return cls(
+            year=np.empty(n_years, dtype=np.int32),
+            age=np.empty(n_years, dtype=np.int32),
+            ira_balance=np.empty(n_years, dtype=np.float64),
+            taxable_balance=np.empty(n_years, dtype=np.float64),
+            taxable_basis=np.empty(n_years, dtype=np.float64),
+            rmd_taken=np.empty(n_years, dtype=np.float64),
+            taxes_paid=np.empty(n_years, dtype=np.float64),
+            market_return=np.empty(n_years, dtype=np.float64),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.year)
 
 
 def simulate_hold_to_death(
@@ -86,7 +122,8 @@ def simulate_hold_to_death(
     tax_bracket: float = 0.24,
     cap_gains_rate: float = 0.15,
     rmd_start_age: int = 73,
-) -> Tuple[float, float, float, float, List[YearSnapshot]]:
+    return_snapshots: bool = False,
+) -> Tuple[float, float, float, float, Optional[Snapshots]]:
     """
     Simulate the Hold-to-Death strategy.
     
@@ -103,6 +140,7 @@ def simulate_hold_to_death(
         tax_bracket: Marginal income tax rate
         cap_gains_rate: Long-term capital gains rate
         rmd_start_age: Age when RMDs begin
+        return_snapshots: Record the per-year Snapshots (None otherwise)
     
     Returns:
         Tuple of (terminal_wealth, total_taxes, total_rmds, step_up_benefit, snapshots)
@@ -115,11 +153,11 @@ def simulate_hold_to_death(
     
     total_taxes = 0.0
     total_rmds = 0.0
-    snapshots = []
+    snapshots = Snapshots.empty(max(years_to_simulate, 0)) if return_snapshots else None
     
     for year in range(years_to_simulate):
         age = start_age + year + 1  # Age at end of year
-        market_return = market_returns[year] if year < len(market_returns) else 0.0
+        market_return = float(market_returns[year]) if year < len(market_returns) else 0.0
         
         # Apply market return to both accounts
         ira *= (1 + market_return)
@@ -136,16 +174,15 @@ def simulate_hold_to_death(
         else:
             taxes = 0.0
         
-        snapshots.append(YearSnapshot(
-            year=year + 1,
-            age=age,
-            ira_balance=ira,
-            taxable_balance=taxable,
-            taxable_basis=basis,
-            rmd_taken=rmd,
-            taxes_paid=taxes,
-            market_return=market_return,
-        ))
+        if return_snapshots:
+            snapshots.year[year] = year + 1
+            snapshots.age[year] = age
+            snapshots.ira_balance[year] = ira
+            snapshots.taxable_balance[year] = taxable
+            snapshots.taxable_basis[year] = basis
+            snapshots.rmd_taken[year] = rmd
+            snapshots.taxes_paid[year] = taxes
+            snapshots.market_return[year] = market_return
     
     # At death: calculate terminal wealth
     # IRA is fully taxable to heirs (no step-up)
@@ -173,12 +210,15 @@ def simulate_aggressive_conversion(
     cap_gains_rate: float = 0.15,
     annual_conversion: float = 100_000,
     conversion_end_age: int = 72,
-) -> Tuple[float, float, float, float, List[YearSnapshot]]:
+    return_snapshots: bool = False,
+) -> Tuple[float, float, float, float, Optional[Snapshots]]:
     """
     Simulate the Aggressive Roth Conversion strategy.
     
     Strategy: Convert $X per year from Traditional IRA to Roth IRA
     until RMDs begin. Pay taxes now at known rates.
+    
+    Arguments and return value follow simulate_hold_to_death.
     """
     years_to_simulate = death_age - start_age
     
@@ -189,11 +229,11 @@ def simulate_aggressive_conversion(
     
     total_taxes = 0.0
     total_rmds = 0.0
-    snapshots = []
+    snapshots = Snapshots.empty(max(years_to_simulate, 0)) if return_snapshots else None
     
     for year in range(years_to_simulate):
         age = start_age + year + 1
-        market_return = market_returns[year] if year < len(market_returns) else 0.0
+        market_return = float(market_returns[year]) if year < len(market_returns) else 0.0
         
         # Apply market return
         ira *= (1 + market_return)
@@ -218,16 +258,15 @@ def simulate_aggressive_conversion(
             total_taxes += rmd_tax
             total_rmds += rmd
         
-        snapshots.append(YearSnapshot(
-            year=year + 1,
-            age=age,
-            ira_balance=ira + roth,  # Combined for comparison
-            taxable_balance=taxable,
-            taxable_basis=basis,
-            rmd_taken=rmd,
-            taxes_paid=conversion_tax + rmd_tax,
-            market_return=market_return,
-        ))
+        if return_snapshots:
+            snapshots.year[year] = year + 1
+            snapshots.age[year] = age
+            snapshots.ira_balance[year] = ira + roth  # Combined for comparison
+            snapshots.taxable_balance[year] = taxable
+            snapshots.taxable_basis[year] = basis
+            snapshots.rmd_taken[year] = rmd
+            snapshots.taxes_paid[year] = conversion_tax + rmd_tax
+            snapshots.market_return[year] = market_return
     
     # Terminal wealth
     ira_after_tax = ira * (1 - tax_bracket)
@@ -240,3 +279,219 @@ def simulate_aggressive_conversion(
     
     return terminal_wealth, total_taxes, total_rmds, step_up_benefit, snapshots
 
+
+
+# =============================================================================
+# COMPILED KERNELS
+# =============================================================================
+
+# Paths per work unit in the batch driver: 64 paths x 35 years of float32
+# returns is ~9 KB, which fits in L1 alongside the kernels' scalar state
+PATH_BLOCK_SIZE = 64
+
+@vectorize(['float64(float64, int64)'], cache=True)
+def rmd_amount(ira_balance, age):
+    """
+    Ufunc version of calculate_rmd using the flat divisor table.
+    
+    Callable on scalars from the compiled kernels or element-wise on
+    arrays of balances and ages.
+    """
+    if age < RMD_START_AGE:
+        return 0.0
+    return ira_balance / RMD_DIVISOR_ARR[min(age, RMD_DIVISOR_ARR.shape[0] - 1)]
+
+
+@njit(cache=True)
+def hold_to_death_kernel(
+    initial_ira,
+    initial_taxable,
+    taxable_basis,
+    start_age,
+    death_age,
+    market_returns,
+    tax_bracket,
+    cap_gains_rate,
+):
+    """
+    Scalar version of simulate_hold_to_death for use inside compiled loops.
+    
+    Returns:
+        Tuple of (terminal_wealth, total_taxes, total_rmds, step_up_benefit)
+    """
+    ira = initial_ira
+    taxable = initial_taxable
+    total_taxes = 0.0
+    total_rmds = 0.0
+    
+    for year in range(death_age - start_age):
+        age = start_age + year + 1
+        market_return = market_returns[year] if year < market_returns.shape[0] else 0.0
+        
+        ira *= (1 + market_return)
+        taxable *= (1 + market_return)
+        
+        rmd = rmd_amount(ira, age)
+        if rmd > 0:
+            ira -= rmd
+            total_taxes += rmd * tax_bracket
+            total_rmds += rmd
+    
+    step_up_benefit = (taxable - taxable_basis) * cap_gains_rate
+    terminal_wealth = ira * (1 - tax_bracket) + taxable
+    
+    return terminal_wealth, total_taxes, total_rmds, step_up_benefit
+
+
+@njit(cache=True)
+def aggressive_conversion_kernel(
+    initial_ira,
+    initial_taxable,
+    taxable_basis,
+    start_age,
+    death_age,
+    market_returns,
+    tax_bracket,
+    cap_gains_rate,
+    annual_conversion,
+    conversion_end_age,
+):
+    """
+    Scalar version of simulate_aggressive_conversion for use inside compiled loops.
+    
+    Returns:
+        Tuple of (terminal_wealth, total_taxes, total_rmds, step_up_benefit)
+    """
+    ira = initial_ira
+    roth = 0.0
+    taxable = initial_taxable
+    total_taxes = 0.0
+    total_rmds = 0.0
+    
+    for year in range(death_age - start_age):
+        age = start_age + year + 1
+        market_return = market_returns[year] if year < market_returns.shape[0] else 0.0
+        
+        ira *= (1 + market_return)
+        roth *= (1 + market_return)
+        taxable *= (1 + market_return)
+        
+        if age <= conversion_end_age and ira > 0:
+            convert_amount = min(annual_conversion, ira)
+            ira -= convert_amount
+            roth += convert_amount
+            total_taxes += convert_amount * tax_bracket
+        
+        rmd = rmd_amount(ira, age)
+        if rmd > 0:
+            ira -= rmd
+            total_taxes += rmd * tax_bracket
+            total_rmds += rmd
+    
+    step_up_benefit = (taxable - taxable_basis) * cap_gains_rate
+    terminal_wealth = ira * (1 - tax_bracket) + roth + taxable
+    
+    return terminal_wealth, total_taxes, total_rmds, step_up_benefit
+
+
+@njit(parallel=True, cache=True)
+def simulate_strategies_batch(
+    market_returns,
+    death_ages,
+    initial_ira,
+    initial_taxable,
+    taxable_basis,
+    start_age,
+    tax_bracket,
+    cap_gains_rate,
+    annual_conversion,
+    conversion_end_age,
+    terminal_wealth,
+    total_taxes_paid,
+    total_rmd,
+    step_up,
+):
+    """
+    Run both strategies over every path, in parallel across paths.
+    
+    Column 0 of each output array holds Hold-to-Death results and
+    column 1 holds Aggressive Conversion results.
+    
+    Args:
+        market_returns: Annual returns of shape (n_paths, max_years)
+        death_ages: Death age per path, shape (n_paths,)
+        terminal_wealth: Output array of shape (n_paths, 2)
+        total_taxes_paid: Output array of shape (n_paths, 2)
+        total_rmd: Output array of shape (n_paths, 2)
+        step_up: Output array of shape (n_paths, 2)
+    """
+    n_paths = death_ages.shape[0]
+    n_blocks = (n_paths + PATH_BLOCK_SIZE - 1) // PATH_BLOCK_SIZE
+    
+    # Each thread takes whole blocks of paths so the block's return rows
+    # stay cache-resident while both strategies read them
+    for b in prange(n_blocks):
+        for i in range(b * PATH_BLOCK_SIZE, min((b + 1) * PATH_BLOCK_SIZE, n_paths)):
+            returns = market_returns[i]
+            death_age = death_ages[i]
+            
+            tw, tax, rmd, step = hold_to_death_kernel(
+                initial_ira, initial_taxable, taxable_basis, start_age,
+                death_age, returns, tax_bracket, cap_gains_rate,
+            )
+            terminal_wealth[i, 0] = tw
+            total_taxes_paid[i, 0] = tax
+            total_rmd[i, 0] = rmd
+            step_up[i, 0] = step
+            
+            tw, tax, rmd, step = aggressive_conversion_kernel(
+                initial_ira, initial_taxable, taxable_basis, start_age,
+                death_age, returns, tax_bracket, cap_gains_rate,
+                annual_conversion, conversion_end_age,
+            )
+            terminal_wealth[i, 1] = tw
+            total_taxes_paid[i, 1] = tax
+            total_rmd[i, 1] = rmd
+            step_up[i, 1] = step
+
+
+@njit(parallel=True, cache=True)
+def column_stats(values):
+    """
+    Mean, sample variance, min and max of each column in one parallel pass.
+    
+    Sums are taken about each column's first value so the variance does
+    not lose precision to cancellation on large wealth figures.
+    
+    Args:
+        values: Array of shape (n_rows, n_cols), e.g. terminal wealth
+    
+    Returns:
+        Tuple of (mean, variance, minimum, maximum), each of shape (n_cols,)
+    """
+    n_rows, n_cols = values.shape
+    mean = np.empty(n_cols)
+    variance = np.zeros(n_cols)
+    minimum = np.empty(n_cols)
+    maximum = np.empty(n_cols)
+    
+    for j in range(n_cols):
+        shift = values[0, j]
+        total = 0.0
+        total_sq = 0.0
+        lo = shift
+        hi = shift
+        for i in prange(n_rows):
+            value = values[i, j]
+            total += value - shift
+            total_sq += (value - shift) * (value - shift)
+            lo = min(lo, value)
+            hi = max(hi, value)
+        
+        mean[j] = shift + total / n_rows
+        if n_rows > 1:
+            variance[j] = (total_sq - total * total / n_rows) / (n_rows - 1)
+        minimum[j] = lo
+        maximum[j] = hi
+    
+    return mean, variance, minimum, maximum
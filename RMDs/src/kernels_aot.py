@@ -0,0 +1,42 @@
+"""
+Ahead-of-Time Build of the Strategy Kernels
+
+Compiles the batch drivers from tax_strategies.py into a native extension
+module, strategy_kernels, using numba.pycc. The compiled module needs
+neither Numba nor a JIT warm-up at run time, so tax_strategies.py uses it
+when Numba is not installed instead of the slower fallbacks.
+
+With Numba installed the JIT drivers, cached on disk (cache=True), are
+preferred: they run paths in parallel, which pycc does not support.
+Loading the JIT cache still costs a few seconds per process, so for short
+runs the AOT module starts faster.
+
+Usage:
+    python kernels_aot.py
+"""
+
+from numba.pycc import CC
+
+from tax_strategies import _run_htd_batch, _run_agg_batch
+
+cc = CC('strategy_kernels')
+
+# (death_ages, market_returns, ira0, taxable0, basis0, start_age,
+#  rmd_divisors_arr, tax_bracket, cap_gains_rate, ...)
+_DRIVER_ARGS = 'i8[:], f8[:, :], f8, f8, f8, i8, f8[:], f8, f8'
+_DRIVER_OUTPUTS = 'f8[:], f8[:], f8[:], f8[:]'
+
+# prange compiles to a plain range without parallel=True
+cc.export(
+    'run_htd_batch',
+    f'void({_DRIVER_ARGS}, {_DRIVER_OUTPUTS})',
+)(_run_htd_batch.py_func)
+
+cc.export(
+    'run_agg_batch',
+    f'void({_DRIVER_ARGS}, f8, i8, {_DRIVER_OUTPUTS})',
+)(_run_agg_batch.py_func)
+
+
+if __name__ == '__main__':
+    cc.compile()
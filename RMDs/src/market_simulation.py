@@ -41,7 +41,9 @@ class MarketSimulator:
         self, 
         n_years: int, 
         n_paths: int = 1,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None,
+        dtype: type = np.float64
     ) -> np.ndarray:
         """
         Generate annual returns using GBM.
@@ -50,24 +52,28 @@ class MarketSimulator:
             n_years: Number of years to simulate
             n_paths: Number of independent paths
             seed: Random seed for reproducibility
+            rng: Generator to draw from (takes precedence over seed)
+            dtype: np.float64 or np.float32 (half the memory; a year's
+                return only needs ~6 significant digits)
         
         Returns:
             Array of shape (n_paths, n_years) with annual returns
         """
-        if seed is not None:
-            np.random.seed(seed)
+        if rng is None:
+            rng = np.random.default_rng(seed)
         
         # Generate standard normal random variables
-        Z = np.random.standard_normal((n_paths, n_years))
+        Z = rng.standard_normal((n_paths, n_years), dtype=dtype)
         
-        # GBM discrete returns
+        # GBM discrete returns, built in place in Z's buffer
         # log(S_t+1 / S_t) ~ N((mu - 0.5*sigma^2), sigma^2)
-        log_returns = (self.mu - 0.5 * self.sigma**2) + self.sigma * Z
+        Z *= self.sigma
+        Z += self.mu - 0.5 * self.sigma**2
         
-        # Convert to simple returns
-        returns = np.exp(log_returns) - 1
+        # Convert to simple returns: exp(log_return) - 1
+        np.expm1(Z, out=Z)
         
-        return returns
+        return Z
     
     def simulate_paths(
         self,
@@ -91,12 +97,12 @@ class MarketSimulator:
         """
         returns = self.simulate_returns(n_years, n_paths, seed)
         
-        # Build price paths
-        paths = np.zeros((n_paths, n_years + 1))
+        # Build price paths: compound the growth factors in one cumprod
+        growth = 1.0 + returns
+        paths = np.empty((n_paths, n_years + 1), dtype=np.float64)
         paths[:, 0] = initial_value
-        
-        for t in range(n_years):
-            paths[:, t + 1] = paths[:, t] * (1 + returns[:, t])
+        np.cumprod(growth, axis=1, out=paths[:, 1:])
+        paths[:, 1:] *= initial_value
         
         return paths
 
@@ -6,7 +6,7 @@ market simulation, survival sampling, and tax strategy execution.
 """
 
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from market_simulation import MarketSimulator
 from survival_analysis import SurvivalModel
@@ -101,55 +101,108 @@ class SimulationEngine:
         Returns:
             List of result dictionaries, one per simulation
         """
-        if seed is not None:
-            np.random.seed(seed)
+        death_ages, market_returns = self._generate_paths(
+            start_age, gender, n_simulations, max_years, seed
+        )
+        return self._run_on_paths(
+            strategy, death_ages, market_returns,
+            start_age, initial_ira, initial_taxable, cost_basis
+        )
+    
+    def _generate_paths(
+        self,
+        start_age: int,
+        gender: str,
+        n_simulations: int,
+        max_years: int,
+        seed: Optional[int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sample the death ages and market returns for a Monte Carlo run.
+        
+        Returns:
+            Tuple of (death_ages, market_returns) with shapes
+            (n_simulations,) and (n_simulations, max_years)
+        """
+        # One generator per run, split into independent mortality and
+        # market streams
+        mortality_rng, market_rng = np.random.default_rng(seed).spawn(2)
         
         # Sample death ages
         death_ages = self.survival.sample_death_ages(
             current_age=start_age,
             n_samples=n_simulations,
             gender=gender,
-            seed=seed
+            rng=mortality_rng
         )
         
         # Generate market returns for all paths
         # Use max_years to ensure we have enough returns for longest-lived
+        # float32 halves the buffer; strategies accumulate in float64
         market_returns = self.market.simulate_returns(
             n_years=max_years,
             n_paths=n_simulations,
-            seed=seed + 1 if seed else None
+            rng=market_rng,
+            dtype=np.float32
         )
         
-        # Run simulations
-        results = []
-        for i in range(n_simulations):
-            result = self.run_single_simulation(
-                strategy=strategy,
-                start_age=start_age,
-                death_age=death_ages[i],
-                initial_ira=initial_ira,
-                initial_taxable=initial_taxable,
-                cost_basis=cost_basis,
-                market_returns=market_returns[i]
-            )
-            results.append(result)
+        return death_ages, market_returns
+    
+    def _run_on_paths(
+        self,
+        strategy: TaxStrategy,
+        death_ages: np.ndarray,
+        market_returns: np.ndarray,
+        start_age: int,
+        initial_ira: float,
+        initial_taxable: float,
+        cost_basis: float
+    ) -> List[Dict]:
+        """Run a strategy over pre-generated paths, one result dict per path."""
+        # Run all paths in one batch
+        batch = strategy.simulate_batch(
+            initial_ira=initial_ira,
+            initial_taxable=initial_taxable,
+            cost_basis=cost_basis,
+            start_age=start_age,
+            death_ages=death_ages,
+            market_returns=market_returns
+        )
         
-        return results
+        return [dict(zip(batch, values)) for values in zip(*batch.values())]
     
     def compare_strategies(
         self,
         strategies: List[TaxStrategy],
         strategy_names: List[str],
-        **kwargs
+        start_age: int,
+        gender: str,
+        initial_ira: float,
+        initial_taxable: float,
+        cost_basis: float,
+        n_simulations: int = 10_000,
+        max_years: int = 55,
+        seed: Optional[int] = None
     ) -> Dict[str, List[Dict]]:
         """
         Run Monte Carlo for multiple strategies with same random paths.
         
+        The death ages and market returns are generated once and every
+        strategy runs on them (common random numbers), so differences
+        between strategies are not masked by sampling noise. Arguments
+        are the same as run_monte_carlo.
+        
         Returns:
             Dictionary mapping strategy name to list of results
         """
+        death_ages, market_returns = self._generate_paths(
+            start_age, gender, n_simulations, max_years, seed
+        )
+        
         all_results = {}
         for strategy, name in zip(strategies, strategy_names):
-            all_results[name] = self.run_monte_carlo(strategy=strategy, **kwargs)
+            all_results[name] = self._run_on_paths(
+                strategy, death_ages, market_returns,
+                start_age, initial_ira, initial_taxable, cost_basis
+            )
         return all_results
-
@@ -69,12 +69,27 @@ SSA_DEATH_PROBABILITY = {
 }
 
 
+# q_x for ages 0-119 interpolated linearly between the table ages
+# (read-only arrays indexed by age)
+_ANCHOR_AGES = np.array(sorted(SSA_DEATH_PROBABILITY.keys()))
+SSA_Q_MALE = np.interp(
+    np.arange(120), _ANCHOR_AGES,
+    [SSA_DEATH_PROBABILITY[a][0] for a in _ANCHOR_AGES]
+)
+SSA_Q_FEMALE = np.interp(
+    np.arange(120), _ANCHOR_AGES,
+    [SSA_DEATH_PROBABILITY[a][1] for a in _ANCHOR_AGES]
+)
+SSA_Q_MALE.setflags(write=False)
+SSA_Q_FEMALE.setflags(write=False)
+
+
 class SurvivalModel:
     """
     Models human survival using SSA actuarial life tables.
     
-    Uses mortality chain approach: for each year, sample whether
-    the person dies based on age-specific death probability q_x.
+    Death ages are drawn by inverse transform sampling from the
+    death-age CDF implied by the age-specific death probabilities q_x.
     """
     
     def __init__(self, max_age: int = 119):
@@ -86,37 +101,19 @@ class SurvivalModel:
         """
         self.max_age = max_age
         self._build_mortality_table()
+        # Death-age CDFs keyed by (gender, start_age), built on first use
+        self._cdf_cache = {}
     
     def _build_mortality_table(self):
         """Build interpolated mortality table for all ages."""
-        self.q_male = {}
-        self.q_female = {}
+        # Ages past the table take the q_x of age 119, which is 1.0
+        ages = np.minimum(np.arange(self.max_age + 1), len(SSA_Q_MALE) - 1)
+        self._q_m = SSA_Q_MALE[ages]
+        self._q_f = SSA_Q_FEMALE[ages]
         
-        ages = sorted(SSA_DEATH_PROBABILITY.keys())
-        
-        for age in range(self.max_age + 1):
-            if age in SSA_DEATH_PROBABILITY:
-                self.q_male[age] = SSA_DEATH_PROBABILITY[age][0]
-                self.q_female[age] = SSA_DEATH_PROBABILITY[age][1]
-            else:
-                # Linear interpolation
-                for i, a in enumerate(ages):
-                    if a > age:
-                        lower = ages[i - 1]
-                        upper = a
-                        frac = (age - lower) / (upper - lower)
-                        self.q_male[age] = (
-                            SSA_DEATH_PROBABILITY[lower][0] * (1 - frac) +
-                            SSA_DEATH_PROBABILITY[upper][0] * frac
-                        )
-                        self.q_female[age] = (
-                            SSA_DEATH_PROBABILITY[lower][1] * (1 - frac) +
-                            SSA_DEATH_PROBABILITY[upper][1] * frac
-                        )
-                        break
-                else:
-                    self.q_male[age] = 1.0
-                    self.q_female[age] = 1.0
+        # Dict views by age
+        self.q_male = dict(enumerate(self._q_m.tolist()))
+        self.q_female = dict(enumerate(self._q_f.tolist()))
     
     def get_death_probability(self, age: int, gender: str = 'M') -> float:
         """Get probability of dying within one year at given age."""
@@ -128,7 +125,8 @@ class SurvivalModel:
         current_age: int,
         n_samples: int,
         gender: str = 'M',
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None
     ) -> np.ndarray:
         """
         Sample death ages from the survival distribution.
@@ -138,25 +136,33 @@ class SurvivalModel:
             n_samples: Number of samples to generate
             gender: 'M' for male, 'F' for female
             seed: Random seed for reproducibility
+            rng: Generator to draw from (takes precedence over seed)
         
         Returns:
             Array of death ages, shape (n_samples,)
         """
-        if seed is not None:
-            np.random.seed(seed)
+        if rng is None:
+            rng = np.random.default_rng(seed)
         
-        q_table = self.q_male if gender.upper() == 'M' else self.q_female
-        death_ages = np.zeros(n_samples, dtype=int)
+        death_cdf = self._death_cdf(current_age, gender.upper())
+        u = rng.random(n_samples)
+        idx = np.searchsorted(death_cdf, u)
         
-        for i in range(n_samples):
-            age = current_age
-            while age < self.max_age:
-                if np.random.random() < q_table.get(age, 1.0):
-                    death_ages[i] = age
-                    break
-                age += 1
-            else:
-                death_ages[i] = self.max_age
+        return np.minimum(current_age + idx, self.max_age).astype(np.int32)
+    
+    def _death_cdf(self, start_age: int, gender: str) -> np.ndarray:
+        """
+        CDF of death age for someone alive at start_age (cached).
         
-        return death_ages
-
+        Entry i is the probability of dying at or before age start_age + i.
+        Anyone who survives to max_age is counted as dying there, so the
+        last entry is exactly 1.0.
+        """
+        key = (gender, start_age)
+        if key not in self._cdf_cache:
+            q = self._q_m if gender == 'M' else self._q_f
+            # cumprod of survival rather than exp(cumsum(log1p(-q))), which
+            # would take log(0) wherever q_x is 1.0
+            death_cdf = 1 - np.cumprod(1 - q[start_age:self.max_age])
+            self._cdf_cache[key] = np.append(death_cdf, 1.0)
+        return self._cdf_cache[key]
@@ -9,6 +9,20 @@ import numpy as np
 from typing import Dict, List, Tuple
 from abc import ABC, abstractmethod
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
 # IRS Uniform Lifetime Table (2024) - RMD divisors by age
 RMD_DIVISORS = {
     72: 27.4, 73: 26.5, 74: 25.5, 75: 24.6, 76: 23.7,
@@ -23,13 +37,195 @@ RMD_DIVISORS = {
     117: 2.7, 118: 2.5, 119: 2.3, 120: 2.0,
 }
 
+RMD_START_AGE = 73  # RMDs start at 73 (as of SECURE 2.0)
+
+
+# Keys of the result dictionaries returned by TaxStrategy.simulate
+RESULT_KEYS = ('terminal_wealth', 'total_taxes', 'total_rmds', 'step_up_benefit', 'death_age')
+
+
+# RMD divisors as a read-only array indexed directly by age, usable from
+# compiled kernels; ages past the table use 2.0, and lookups clamp ages
+# past the end of the array to its last entry
+RMD_DIVISOR_ARR = np.full(200, 2.0, dtype=np.float64)
+RMD_DIVISOR_ARR[list(RMD_DIVISORS)] = list(RMD_DIVISORS.values())
+RMD_DIVISOR_ARR.setflags(write=False)
+
+
+@njit(cache=True)
+def _rmd_divisor(divisors: np.ndarray, age: int) -> float:
+    """Look up the RMD divisor for an age, clamping past the end of the table."""
+    return divisors[min(age, divisors.shape[0] - 1)]
+
 
 def calculate_rmd(ira_balance: float, age: int) -> float:
     """Calculate Required Minimum Distribution for a given year."""
-    if age < 73:
+    if age < RMD_START_AGE:
         return 0.0
-    divisor = RMD_DIVISORS.get(age, 2.0)
-    return ira_balance / divisor if divisor > 0 else ira_balance
+    return ira_balance / _rmd_divisor(RMD_DIVISOR_ARR, age)
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_htd_kernel(
+    ira0, taxable0, basis0, start_age, death_age, market_returns,
+    rmd_divisors_arr, tax_bracket, cap_gains_rate
+):
+    """Compiled HoldToDeathStrategy.simulate for a single path."""
+    ira = ira0
+    taxable = taxable0
+    total_taxes = 0.0
+    total_rmds = 0.0
+    
+    years = death_age - start_age
+    # Years before the first RMD (taken in the year RMD_START_AGE is reached)
+    pre_rmd = min(max(RMD_START_AGE - 1 - start_age, 0), years) if years > 0 else 0
+    
+    for year in range(pre_rmd):
+        ret = float(market_returns[year]) if year < market_returns.shape[0] else 0.0
+        ira *= (1 + ret)
+        taxable *= (1 + ret)
+    
+    for year in range(pre_rmd, years):
+        age = start_age + year + 1
+        ret = float(market_returns[year]) if year < market_returns.shape[0] else 0.0
+        
+        ira *= (1 + ret)
+        taxable *= (1 + ret)
+        
+        rmd = ira / _rmd_divisor(rmd_divisors_arr, age)
+        ira -= rmd
+        total_taxes += rmd * tax_bracket
+        total_rmds += rmd
+    
+    step_up_benefit = (taxable - basis0) * cap_gains_rate
+    return ira * (1 - tax_bracket) + taxable, total_taxes, total_rmds, step_up_benefit
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_agg_kernel(
+    ira0, taxable0, basis0, start_age, death_age, market_returns,
+    rmd_divisors_arr, tax_bracket, cap_gains_rate,
+    annual_conversion, conversion_end_age
+):
+    """Compiled AggressiveConversionStrategy.simulate for a single path."""
+    ira = ira0
+    roth = 0.0
+    taxable = taxable0
+    total_taxes = 0.0
+    total_rmds = 0.0
+    
+    years = death_age - start_age
+    # Conversion years come first, then any years before the first RMD,
+    # then the RMD years, each in its own loop
+    conv_years = min(max(conversion_end_age - start_age, 0), years) if years > 0 else 0
+    pre_rmd = min(max(RMD_START_AGE - 1 - start_age, conv_years), years) if years > 0 else 0
+    
+    for year in range(conv_years):
+        age = start_age + year + 1
+        ret = float(market_returns[year]) if year < market_returns.shape[0] else 0.0
+        
+        ira *= (1 + ret)
+        roth *= (1 + ret)
+        taxable *= (1 + ret)
+        
+        if ira > 0:
+            convert = min(annual_conversion, ira)
+            ira -= convert
+            roth += convert
+            total_taxes += convert * tax_bracket
+        
+        # Only reached when conversions run into RMD years
+        if age >= RMD_START_AGE:
+            rmd = ira / _rmd_divisor(rmd_divisors_arr, age)
+            ira -= rmd
+            total_taxes += rmd * tax_bracket
+            total_rmds += rmd
+    
+    for year in range(conv_years, pre_rmd):
+        ret = float(market_returns[year]) if year < market_returns.shape[0] else 0.0
+        ira *= (1 + ret)
+        roth *= (1 + ret)
+        taxable *= (1 + ret)
+    
+    for year in range(pre_rmd, years):
+        age = start_age + year + 1
+        ret = float(market_returns[year]) if year < market_returns.shape[0] else 0.0
+        
+        ira *= (1 + ret)
+        roth *= (1 + ret)
+        taxable *= (1 + ret)
+        
+        rmd = ira / _rmd_divisor(rmd_divisors_arr, age)
+        ira -= rmd
+        total_taxes += rmd * tax_bracket
+        total_rmds += rmd
+    
+    step_up_benefit = (taxable - basis0) * cap_gains_rate
+    return ira * (1 - tax_bracket) + roth + taxable, total_taxes, total_rmds, step_up_benefit
+
+
+@njit(parallel=True, cache=True)
+def _run_htd_batch(
+    death_ages, market_returns, ira0, taxable0, basis0, start_age,
+    rmd_divisors_arr, tax_bracket, cap_gains_rate,
+    out_wealth, out_taxes, out_rmds, out_step_up
+):
+    """Run _simulate_htd_kernel for every path in parallel."""
+    for i in prange(death_ages.shape[0]):
+        out_wealth[i], out_taxes[i], out_rmds[i], out_step_up[i] = _simulate_htd_kernel(
+            ira0, taxable0, basis0, start_age, death_ages[i], market_returns[i],
+            rmd_divisors_arr, tax_bracket, cap_gains_rate
+        )
+
+
+@njit(parallel=True, cache=True)
+def _run_agg_batch(
+    death_ages, market_returns, ira0, taxable0, basis0, start_age,
+    rmd_divisors_arr, tax_bracket, cap_gains_rate,
+    annual_conversion, conversion_end_age,
+    out_wealth, out_taxes, out_rmds, out_step_up
+):
+    """Run _simulate_agg_kernel for every path in parallel."""
+    for i in prange(death_ages.shape[0]):
+        out_wealth[i], out_taxes[i], out_rmds[i], out_step_up[i] = _simulate_agg_kernel(
+            ira0, taxable0, basis0, start_age, death_ages[i], market_returns[i],
+            rmd_divisors_arr, tax_bracket, cap_gains_rate,
+            annual_conversion, conversion_end_age
+        )
+
+
+def _batch_outputs(n_paths: int) -> Tuple[np.ndarray, ...]:
+    """Preallocate the four per-path output arrays for a batch driver."""
+    return tuple(np.empty(n_paths) for _ in range(4))
+
+
+# Without Numba, use the ahead-of-time build of the batch drivers (see
+# kernels_aot.py) if it has been compiled
+HAS_AOT_KERNELS = False
+if not HAS_NUMBA:
+    try:
+        from strategy_kernels import run_htd_batch as _run_htd_batch
+        from strategy_kernels import run_agg_batch as _run_agg_batch
+        HAS_AOT_KERNELS = True
+    except ImportError:
+        pass
+
+
+def _kernel_inputs(
+    death_ages: np.ndarray,
+    market_returns: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cast path inputs for the batch drivers. The JIT specializes on any
+    dtype; the ahead-of-time build only accepts int64 death ages and
+    float64 returns.
+    """
+    if not HAS_AOT_KERNELS:
+        return death_ages, market_returns
+    return (
+        np.ascontiguousarray(death_ages, dtype=np.int64),
+        np.ascontiguousarray(market_returns, dtype=np.float64),
+    )
 
 
 class TaxStrategy(ABC):
@@ -51,6 +247,42 @@ class TaxStrategy(ABC):
     ) -> Dict:
         """Run the strategy simulation and return results."""
         pass
+    
+    def simulate_batch(
+        self,
+        initial_ira: float,
+        initial_taxable: float,
+        cost_basis: float,
+        start_age: int,
+        death_ages: np.ndarray,
+        market_returns: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Run the strategy for many paths at once.
+        
+        The default implementation calls simulate once per path; subclasses
+        override it with versions that process all paths together.
+        
+        Args:
+            death_ages: Death age per path, shape (n_paths,)
+            market_returns: Annual returns, shape (n_paths, n_years)
+        
+        Returns:
+            Dictionary mapping each result key of simulate to an array of
+            shape (n_paths,)
+        """
+        results = [
+            self.simulate(
+                initial_ira=initial_ira,
+                initial_taxable=initial_taxable,
+                cost_basis=cost_basis,
+                start_age=start_age,
+                death_age=death_age,
+                market_returns=market_returns[i]
+            )
+            for i, death_age in enumerate(death_ages)
+        ]
+        return {key: np.array([r[key] for r in results]) for key in RESULT_KEYS}
 
 
 class HoldToDeathStrategy(TaxStrategy):
@@ -78,20 +310,29 @@ class HoldToDeathStrategy(TaxStrategy):
         total_taxes = 0.0
         total_rmds = 0.0
         
-        for year in range(years):
+        # Years before the first RMD (taken in the year RMD_START_AGE is reached)
+        pre_rmd = min(max(RMD_START_AGE - 1 - start_age, 0), max(years, 0))
+        
+        for year in range(pre_rmd):
+            ret = float(market_returns[year]) if year < len(market_returns) else 0.0
+            
+            # Apply market return
+            ira *= (1 + ret)
+            taxable *= (1 + ret)
+        
+        for year in range(pre_rmd, years):
             age = start_age + year + 1
-            ret = market_returns[year] if year < len(market_returns) else 0.0
+            ret = float(market_returns[year]) if year < len(market_returns) else 0.0
             
             # Apply market return
             ira *= (1 + ret)
             taxable *= (1 + ret)
             
-            # Take RMD if required
-            rmd = calculate_rmd(ira, age)
-            if rmd > 0:
-                ira -= rmd
-                total_taxes += rmd * self.tax_bracket
-                total_rmds += rmd
+            # Take RMD
+            rmd = ira / _rmd_divisor(RMD_DIVISOR_ARR, age)
+            ira -= rmd
+            total_taxes += rmd * self.tax_bracket
+            total_rmds += rmd
         
         # Terminal wealth calculation
         ira_after_tax = ira * (1 - self.tax_bracket)
@@ -107,6 +348,102 @@ class HoldToDeathStrategy(TaxStrategy):
             'death_age': death_age
         }
 
+    def simulate_batch(
+        self,
+        initial_ira: float,
+        initial_taxable: float,
+        cost_basis: float,
+        start_age: int,
+        death_ages: np.ndarray,
+        market_returns: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Run simulate over all paths.
+        
+        Uses the compiled parallel kernel when Numba (or the ahead-of-time
+        build) is available and the NumPy-vectorized version otherwise.
+        """
+        death_ages = np.asarray(death_ages)
+        if not (HAS_NUMBA or HAS_AOT_KERNELS):
+            return self._simulate_batch_numpy(
+                initial_ira, initial_taxable, cost_basis, start_age,
+                death_ages, market_returns
+            )
+        
+        outputs = _batch_outputs(len(death_ages))
+        _run_htd_batch(
+            *_kernel_inputs(death_ages, market_returns),
+            float(initial_ira), float(initial_taxable), float(cost_basis), start_age,
+            RMD_DIVISOR_ARR, self.tax_bracket, self.cap_gains_rate,
+            *outputs
+        )
+        return dict(zip(RESULT_KEYS, outputs + (death_ages,)))
+    
+    def _simulate_batch_numpy(
+        self,
+        initial_ira: float,
+        initial_taxable: float,
+        cost_basis: float,
+        start_age: int,
+        death_ages: np.ndarray,
+        market_returns: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized simulate over all paths.
+        
+        Loops over years rather than paths: each year updates every path
+        with array operations, and paths whose owner has already died are
+        masked out so their balances stay frozen.
+        
+        The per-year state is float32, halving the memory traffic of the
+        year loop; results are returned as float64.
+        """
+        n_paths = len(death_ages)
+        years = death_ages - start_age
+        max_years = max(int(years.max()), 0) if n_paths else 0
+        
+        ira = np.full(n_paths, initial_ira, dtype=np.float32)
+        taxable = np.full(n_paths, initial_taxable, dtype=np.float32)
+        
+        total_taxes = np.zeros(n_paths, dtype=np.float32)
+        total_rmds = np.zeros(n_paths, dtype=np.float32)
+        
+        # RMD divisor for the age reached in each year (inf means no RMD)
+        ages = start_age + np.arange(max_years) + 1
+        divisor_by_year = np.where(
+            ages >= RMD_START_AGE, RMD_DIVISOR_ARR[np.minimum(ages, RMD_DIVISOR_ARR.shape[0] - 1)], np.inf
+        ).astype(np.float32)
+        alive = years[:, None] > np.arange(max_years)[None, :]
+        
+        for year in range(max_years):
+            ret = market_returns[:, year] if year < market_returns.shape[1] else 0.0
+            
+            # Apply market return
+            growth = np.where(alive[:, year], 1 + ret, 1.0)
+            ira *= growth
+            taxable *= growth
+            
+            # Take RMD if required
+            rmd = ira / divisor_by_year[year] * alive[:, year]
+            ira -= rmd
+            total_taxes += rmd * self.tax_bracket
+            total_rmds += rmd
+        
+        # Terminal wealth calculation
+        ira = ira.astype(np.float64)
+        taxable = taxable.astype(np.float64)
+        ira_after_tax = ira * (1 - self.tax_bracket)
+        unrealized_gain = taxable - cost_basis
+        step_up_benefit = unrealized_gain * self.cap_gains_rate
+        
+        return {
+            'terminal_wealth': ira_after_tax + taxable,
+            'total_taxes': total_taxes.astype(np.float64),
+            'total_rmds': total_rmds.astype(np.float64),
+            'step_up_benefit': step_up_benefit,
+            'death_age': death_ages
+        }
+
 
 class AggressiveConversionStrategy(TaxStrategy):
     """
@@ -145,29 +482,57 @@ class AggressiveConversionStrategy(TaxStrategy):
         total_taxes = 0.0
         total_rmds = 0.0
         
-        for year in range(years):
+        # Conversion years come first, then any years before the first
+        # RMD, then the RMD years, each in its own loop
+        conv_years = min(max(self.conversion_end_age - start_age, 0), max(years, 0))
+        pre_rmd = min(max(RMD_START_AGE - 1 - start_age, conv_years), max(years, 0))
+        
+        for year in range(conv_years):
             age = start_age + year + 1
-            ret = market_returns[year] if year < len(market_returns) else 0.0
+            ret = float(market_returns[year]) if year < len(market_returns) else 0.0
             
             # Apply market return
             ira *= (1 + ret)
             roth *= (1 + ret)
             taxable *= (1 + ret)
             
-            # Roth conversion before RMD age
-            if age <= self.conversion_end_age and ira > 0:
+            # Roth conversion
+            if ira > 0:
                 convert = min(self.annual_conversion, ira)
                 ira -= convert
                 roth += convert
                 total_taxes += convert * self.tax_bracket
             
-            # Take RMD on remaining IRA
+            # RMD on remaining IRA (only once conversions run into RMD years)
             rmd = calculate_rmd(ira, age)
             if rmd > 0:
                 ira -= rmd
                 total_taxes += rmd * self.tax_bracket
                 total_rmds += rmd
         
+        for year in range(conv_years, pre_rmd):
+            ret = float(market_returns[year]) if year < len(market_returns) else 0.0
+            
+            # Apply market return
+            ira *= (1 + ret)
+            roth *= (1 + ret)
+            taxable *= (1 + ret)
+        
+        for year in range(pre_rmd, years):
+            age = start_age + year + 1
+            ret = float(market_returns[year]) if year < len(market_returns) else 0.0
+            
+            # Apply market return
+            ira *= (1 + ret)
+            roth *= (1 + ret)
+            taxable *= (1 + ret)
+            
+            # Take RMD
+            rmd = ira / _rmd_divisor(RMD_DIVISOR_ARR, age)
+            ira -= rmd
+            total_taxes += rmd * self.tax_bracket
+            total_rmds += rmd
+        
         # Terminal wealth
         ira_after_tax = ira * (1 - self.tax_bracket)
         roth_after_tax = roth  # Tax-free
@@ -181,4 +546,24 @@ class AggressiveConversionStrategy(TaxStrategy):
             'step_up_benefit': step_up_benefit,
             'death_age': death_age
         }
-
+    
+    def simulate_batch(
+        self,
+        initial_ira: float,
+        initial_taxable: float,
+        cost_basis: float,
+        start_age: int,
+        death_ages: np.ndarray,
+        market_returns: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Run simulate over all paths with the compiled parallel kernel."""
+        death_ages = np.asarray(death_ages)
+        outputs = _batch_outputs(len(death_ages))
+        _run_agg_batch(
+            *_kernel_inputs(death_ages, market_returns),
+            float(initial_ira), float(initial_taxable), float(cost_basis), start_age,
+            RMD_DIVISOR_ARR, self.tax_bracket, self.cap_gains_rate,
+            float(self.annual_conversion), self.conversion_end_age,
+            *outputs
+        )
+        return dict(zip(RESULT_KEYS, outputs + (death_ages,)))
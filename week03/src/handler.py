@@ -1,13 +1,31 @@
 import json
 import os
+import time
 import boto3
-from decimal import Decimal
+import orjson
+from decimal import Clamped, Context, Decimal, DecimalException, Overflow, Underflow
 
 # Initialize DynamoDB resource
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table(os.environ.get('TABLE_NAME', 'items'))
 
 
+# DynamoDB limit on keys per BatchGetItem request
+BATCH_GET_SIZE = 100
+
+# Retries for unprocessed batch keys, with exponential backoff starting at
+# BATCH_RETRY_DELAY seconds; shared by the whole request so the waits stay
+# well inside the Lambda timeout
+BATCH_MAX_RETRIES = 4
+BATCH_RETRY_DELAY = 0.05
+
+
+# DynamoDB numbers hold at most 38 significant digits within exponents
+# -128..126. Request floats are rounded to 38 digits; magnitudes outside
+# the range raise, and are reported as a 400.
+DYNAMODB_NUMBER_CONTEXT = Context(prec=38, Emin=-128, Emax=126, traps=[Clamped, Overflow, Underflow])
+
+
 # CORS headers to include in all responses
 CORS_HEADERS = {
     'Access-Control-Allow-Origin': '*',
@@ -38,10 +56,15 @@ def lambda_handler(event, context):
 
 def handle_get(event):
     """
-    Handle GET requests to retrieve an item by ID.
+    Handle GET requests to retrieve an item by ID, or several items
+    when an ids query parameter (comma-separated) is given.
     """
+    ids = (event.get('queryStringParameters') or {}).get('ids')
+    if ids:
+        return handle_batch_get(ids.split(','))
+
     # Extract item ID from path parameters
-    item_id = event.get('pathParameters', {}).get('id')
+    item_id = (event.get('pathParameters') or {}).get('id')
     
     if not item_id:
         return {
@@ -55,12 +78,11 @@ def handle_get(event):
         response = table.get_item(Key={'id': item_id})
 
         if 'Item' in response:
-            # Convert Decimal to float for JSON serialization
-            item = convert_decimals(response['Item'])
+            # orjson walks the item in C, converting Decimals via _default
             return {
                 'statusCode': 200,
                 'headers': CORS_HEADERS,
-                'body': json.dumps(item)
+                'body': orjson.dumps(response['Item'], default=_default).decode()
             }
         else:
             return {
@@ -76,13 +98,64 @@ def handle_get(event):
         }
 
 
+def handle_batch_get(ids):
+    """
+    Retrieve several items with BatchGetItem, up to 100 keys per request.
+    Ids that are not found are left out of the response. Keys DynamoDB
+    leaves unprocessed (e.g. when throttled) are retried with backoff;
+    any still unprocessed after BATCH_MAX_RETRIES are listed under
+    'unprocessed' so the client can ask for them again.
+    """
+    try:
+        # BatchGetItem rejects duplicate keys
+        ids = list(dict.fromkeys(i for i in ids if i))
+        items = []
+        unprocessed = []
+        retries = 0
+        for start in range(0, len(ids), BATCH_GET_SIZE):
+            request = {table.name: {'Keys': [{'id': i} for i in ids[start:start + BATCH_GET_SIZE]]}}
+            while True:
+                response = dynamodb.batch_get_item(RequestItems=request)
+                items.extend(response['Responses'].get(table.name, []))
+                request = response.get('UnprocessedKeys')
+                if not request:
+                    break
+                if retries == BATCH_MAX_RETRIES:
+                    unprocessed.extend(key['id'] for key in request[table.name]['Keys'])
+                    break
+                time.sleep(BATCH_RETRY_DELAY * 2 ** retries)
+                retries += 1
+
+        body = {'items': items}
+        if unprocessed:
+            body['unprocessed'] = unprocessed
+        return {
+            'statusCode': 200,
+            'headers': CORS_HEADERS,
+            'body': orjson.dumps(body, default=_default).decode()
+        }
+    except Exception as e:
+        return {
+            'statusCode': 500,
+            'headers': CORS_HEADERS,
+            'body': json.dumps({'error': str(e)})
+        }
+
+
 def handle_post(event):
     """
-    Handle POST requests to create a new item.
+    Handle POST requests to create a new item, or several items when
+    the body is a JSON list.
     """
     try:
-        # Parse request body
-        body = json.loads(event.get('body', '{}'))
+        # Parse request body, reading numbers with a fraction straight into
+        # Decimal for DynamoDB (no float round-trip or repr per value)
+        body = json.loads(
+            event.get('body', '{}'),
+            parse_float=DYNAMODB_NUMBER_CONTEXT.create_decimal
+        )
+        if isinstance(body, list):
+            return handle_batch_post(body)
         
         # Validate required fields
         item_id = body.get('id')
@@ -93,17 +166,20 @@ def handle_post(event):
                 'body': json.dumps({'error': 'Missing id in request body'})
             }
 
-        # Convert floats to Decimal for DynamoDB
-        item = convert_floats(body)
-
         # Store item in DynamoDB
-        table.put_item(Item=item)
+        table.put_item(Item=body)
 
         return {
             'statusCode': 201,
             'headers': CORS_HEADERS,
             'body': json.dumps({'message': 'Item created', 'id': item_id})
         }
+    except DecimalException:
+        return {
+            'statusCode': 400,
+            'headers': CORS_HEADERS,
+            'body': json.dumps({'error': 'Number out of range for DynamoDB'})
+        }
     except Exception as e:
         return {
             'statusCode': 500,
@@ -112,30 +188,33 @@ def handle_post(event):
         }
 
 
-def convert_floats(obj):
+def handle_batch_post(items):
     """
-    Recursively convert float values to Decimal for DynamoDB storage.
+    Store several items with BatchWriteItem. The batch writer sends them
+    25 at a time and resends any unprocessed items.
     """
-    if isinstance(obj, list):
-        return [convert_floats(i) for i in obj]
-    elif isinstance(obj, dict):
-        return {k: convert_floats(v) for k, v in obj.items()}
-    elif isinstance(obj, float):
-        return Decimal(str(obj))
-    else:
-        return obj
+    if not all(isinstance(item, dict) and item.get('id') for item in items):
+        return {
+            'statusCode': 400,
+            'headers': CORS_HEADERS,
+            'body': json.dumps({'error': 'Missing id in request body'})
+        }
 
+    with table.batch_writer(overwrite_by_pkeys=['id']) as batch:
+        for item in items:
+            batch.put_item(Item=item)
 
-def convert_decimals(obj):
+    return {
+        'statusCode': 201,
+        'headers': CORS_HEADERS,
+        'body': json.dumps({'message': 'Items created', 'ids': [item['id'] for item in items]})
+    }
+
+
+def _default(obj):
     """
-    Recursively convert Decimal values to float for JSON serialization.
+    Serialize values orjson does not handle natively (DynamoDB Decimals).
     """
-    if isinstance(obj, list):
-        return [convert_decimals(i) for i in obj]
-    elif isinstance(obj, dict):
-        return {k: convert_decimals(v) for k, v in obj.items()}
-    elif isinstance(obj, Decimal):
+    if isinstance(obj, Decimal):
         return float(obj)
-    else:
-        return obj
-
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')